@@ -3,644 +3,1199 @@ Fast GitHub Pages Static Site Generator
 Generates a working website from your docs in under 20 minutes
 """
 
+import functools
+import hashlib
+import json
 import os
+import re
 import shutil
-import subprocess
+import string
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from html import unescape
 from pathlib import Path
 import markdown
+from markdown.extensions.toc import slugify, unique
 from datetime import datetime
+from importlib.metadata import version as package_version
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import TextLexer, get_lexer_by_name
+from pygments.util import ClassNotFound
 
+# Optional C-backed / faster markdown parsers, preferred over python-markdown
+try:
+    import cmarkgfm
+    from cmarkgfm.cmark import Options as cmarkgfmOptions
+except ImportError:
+    cmarkgfm = None
 
-class FastSiteGenerator:
-    def __init__(self, source_dir=".", output_dir="docs", format_markdown=True):
-        self.source_dir = Path(source_dir)
-        self.output_dir = Path(output_dir)
-        self.format_markdown = format_markdown
-        self.markdown_extensions = ["toc", "tables", "fenced_code", "codehilite"]
+try:
+    import mistune
+except ImportError:
+    mistune = None
 
-        # Create output directory
-        self.output_dir.mkdir(exist_ok=True)
+# Source files that are rendered to HTML pages
+_DOC_SUFFIXES = frozenset({".md", ".txt"})
 
-    def get_relative_path_to_root(self, current_path):
-        """Calculate relative path from current location to root"""
-        if current_path == Path("."):
-            return "."
-        depth = len(current_path.parts)
-        return "/".join([".."] * depth) if depth > 0 else "."
+# One entry in a directory listing: link target, label, type
+_FILE_ITEM_TMPL = (
+    '<div class="file-item"><a href="{0}">{1}</a>'
+    '<div class="file-type">{2}</div></div>'
+)
+
+# Shared stylesheet and script, written once to <output>/assets/
+_CSS = """\
+:root {
+    --primary: #6366f1;
+    --primary-dark: #4f46e5;
+    --secondary: #8b5cf6;
+    --bg-main: #0f172a;
+    --bg-card: #1e293b;
+    --bg-code: #0f172a;
+    --text-primary: #f1f5f9;
+    --text-secondary: #94a3b8;
+    --border: #334155;
+    --accent: #06b6d4;
+    --success: #10b981;
+}
+
+* { margin: 0; padding: 0; box-sizing: border-box; }
+
+body {
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+    line-height: 1.7;
+    color: var(--text-primary);
+    background: var(--bg-main);
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 20px;
+}
+
+.home-btn {
+    position: fixed;
+    top: 20px;
+    right: 20px;
+    background: var(--accent);
+    color: white;
+    width: 50px;
+    height: 50px;
+    border-radius: 50%;
+    text-decoration: none;
+    z-index: 1000;
+    box-shadow: 0 4px 20px rgba(6, 182, 212, 0.4);
+    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+    font-size: 24px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+}
+
+.home-btn:hover {
+    background: #0891b2;
+    transform: translateY(-2px);
+    box-shadow: 0 8px 30px rgba(6, 182, 212, 0.5);
+}
+
+.breadcrumb {
+    background: var(--bg-card);
+    padding: 12px 0;
+    margin-bottom: 24px;
+    font-size: 14px;
+    border-radius: 8px;
+    border: 1px solid var(--border);
+}
+
+.breadcrumb a {
+    color: var(--accent);
+    text-decoration: none;
+    transition: color 0.2s;
+}
+
+.breadcrumb a:hover {
+    color: var(--primary);
+    text-decoration: underline;
+}
+
+.content {
+    background: var(--bg-card);
+    padding: 3rem;
+    border-radius: 16px;
+    box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
+    border: 1px solid var(--border);
+}
+
+.file-list {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
+    gap: 1.5rem;
+    margin: 2rem 0;
+}
+
+.file-item {
+    padding: 1.5rem;
+    border: 1px solid var(--border);
+    border-radius: 12px;
+    background: var(--bg-main);
+    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+    position: relative;
+    overflow: hidden;
+}
+
+.file-item::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 3px;
+    background: linear-gradient(90deg, var(--primary), var(--secondary));
+    opacity: 0;
+    transition: opacity 0.3s;
+}
+
+.file-item:hover {
+    transform: translateY(-4px);
+    box-shadow: 0 8px 30px rgba(99, 102, 241, 0.3);
+    border-color: var(--primary);
+}
+
+.file-item:hover::before {
+    opacity: 1;
+}
+
+.file-item a {
+    color: var(--text-primary);
+    text-decoration: none;
+    font-weight: 600;
+    display: block;
+    font-size: 1.1rem;
+}
+
+.file-item a:hover {
+    color: var(--primary);
+}
+
+.file-type {
+    font-size: 13px;
+    color: var(--text-secondary);
+    margin-top: 8px;
+    font-weight: 500;
+}
+
+/* Code Blocks */
+pre {
+    background: var(--bg-code);
+    padding: 1.5rem;
+    border-radius: 12px;
+    overflow-x: auto;
+    border: 1px solid var(--border);
+    margin: 1.5rem 0;
+    box-shadow: 0 4px 10px rgba(0, 0, 0, 0.3);
+    position: relative;
+}
+
+pre code {
+    background: none;
+    padding: 0;
+    font-family: 'Fira Code', 'Consolas', monospace;
+    font-size: 0.9em;
+    line-height: 1.6;
+}
+
+/* Copy Button */
+.copy-btn {
+    position: absolute;
+    top: 8px;
+    right: 8px;
+    background: var(--primary);
+    color: white;
+    border: none;
+    padding: 6px 12px;
+    border-radius: 6px;
+    cursor: pointer;
+    font-size: 12px;
+    font-weight: 600;
+    transition: all 0.2s;
+    opacity: 0.7;
+    z-index: 10;
+}
+
+.copy-btn:hover {
+    opacity: 1;
+    background: var(--primary-dark);
+    transform: translateY(-1px);
+}
+
+.copy-btn.copied {
+    background: var(--success);
+}
+
+pre:hover .copy-btn {
+    opacity: 1;
+}
+
+/* Inline Code */
+code {
+    background: var(--bg-code);
+    color: #8b5cf6;
+    padding: 3px 8px;
+    border-radius: 6px;
+    font-size: 1.1em;
+    font-family: 'Fira Code', 'Consolas', monospace;
+    border: 1px solid var(--border);
+}
+
+/* Headings */
+h1, h2, h3, h4, h5, h6 {
+    color: var(--text-primary);
+    margin: 2rem 0 1rem 0;
+    font-weight: 700;
+    letter-spacing: -0.5px;
+}
+
+h1 {
+    font-size: 2.5rem;
+    background: linear-gradient(135deg, var(--primary), var(--secondary));
+    -webkit-background-clip: text;
+    border-bottom: 3px solid var(--primary);
+    padding-bottom: 12px;
+    margin-bottom: 1.5rem;
+}
+
+h2 {
+    font-size: 2rem;
+    color: var(--primary);
+    border-bottom: 2px solid var(--border);
+    padding-bottom: 8px;
+}
+
+h3 {
+    font-size: 1.5rem;
+    color: var(--accent);
+}
+
+/* Links */
+a {
+    color: var(--accent);
+    transition: color 0.2s;
+}
+
+a:hover {
+    color: var(--primary);
+}
+
+/* Paragraphs */
+p {
+    margin: 1rem 0;
+    color: var(--text-secondary);
+}
+
+/* Lists */
+ul, ol {
+    margin: 1rem 0;
+    padding-left: 2rem;
+    color: var(--text-secondary);
+}
+
+li {
+    margin: 0.5rem 0;
+}
+
+/* Tables */
+table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 1.5rem 0;
+    background: var(--bg-main);
+    border-radius: 8px;
+    overflow: hidden;
+    box-shadow: 0 2px 10px rgba(0, 0, 0, 0.2);
+}
+
+th, td {
+    border: 1px solid var(--border);
+    padding: 12px 16px;
+    text-align: left;
+}
+
+th {
+    background: linear-gradient(135deg, var(--primary), var(--secondary));
+    color: white;
+    font-weight: 600;
+}
+
+tr:hover {
+    background: var(--bg-card);
+}
+
+/* Blockquotes */
+blockquote {
+    border-left: 4px solid var(--primary);
+    padding: 1rem 1.5rem;
+    margin: 1.5rem 0;
+    background: var(--bg-main);
+    border-radius: 0 8px 8px 0;
+    color: var(--text-secondary);
+    font-style: italic;
+}
+
+/* Horizontal Rule */
+hr {
+    border: none;
+    border-top: 2px solid var(--border);
+    margin: 2rem 0;
+}
+
+.footer {
+    text-align: center;
+    padding: 2rem;
+    color: var(--text-secondary);
+    border-top: 1px solid var(--border);
+    margin-top: 3rem;
+    font-size: 14px;
+}
+
+/* Scrollbar */
+::-webkit-scrollbar {
+    width: 12px;
+    height: 12px;
+}
+
+::-webkit-scrollbar-track {
+    background: var(--bg-main);
+}
+
+::-webkit-scrollbar-thumb {
+    background: var(--border);
+    border-radius: 6px;
+}
+
+::-webkit-scrollbar-thumb:hover {
+    background: var(--primary);
+}
+
+@media (max-width: 768px) {
+    .container { padding: 10px; }
+    .file-list { grid-template-columns: 1fr; }
+    .content { padding: 1.5rem; }
+    h1 { font-size: 2rem; }
+    h2 { font-size: 1.5rem; }
+}
+"""
+
+_JS = """\
+// Code is highlighted at build time by Pygments; only the copy buttons run here
+document.addEventListener('DOMContentLoaded', (event) => {
+    // Add copy buttons to code blocks
+    document.querySelectorAll('pre').forEach((pre) => {
+        const button = document.createElement('button');
+        button.className = 'copy-btn';
+        button.textContent = 'Copy';
+
+        button.addEventListener('click', () => {
+            const code = pre.querySelector('code').textContent;
+            navigator.clipboard.writeText(code).then(() => {
+                button.textContent = 'Copied!';
+                button.classList.add('copied');
+                setTimeout(() => {
+                    button.textContent = 'Copy';
+                    button.classList.remove('copied');
+                }, 2000);
+            }).catch(err => {
+                console.error('Failed to copy:', err);
+                button.textContent = 'Error';
+                setTimeout(() => {
+                    button.textContent = 'Copy';
+                }, 2000);
+            });
+        });
 
-    def get_html_template(self):
-        """Modern, beautiful HTML template with code highlighting"""
-        return """<!DOCTYPE html>
+        pre.appendChild(button);
+    });
+});
+"""
+
+# Page shells for string.Template. Markdown pages get the Pygments styles and
+# the copy-button script; directory indexes have no code blocks and skip both.
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github-dark.min.css">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
-    <style>
-        :root {{
-            --primary: #6366f1;
-            --primary-dark: #4f46e5;
-            --secondary: #8b5cf6;
-            --bg-main: #0f172a;
-            --bg-card: #1e293b;
-            --bg-code: #0f172a;
-            --text-primary: #f1f5f9;
-            --text-secondary: #94a3b8;
-            --border: #334155;
-            --accent: #06b6d4;
-            --success: #10b981;
-        }}
-        
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        
-        body {{ 
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
-            line-height: 1.7; 
-            color: var(--text-primary); 
-            background: var(--bg-main);
-        }}
-        
-        .container {{ 
-            max-width: 1200px; 
-            margin: 0 auto; 
-            padding: 20px; 
-        }}
-        
-        .home-btn {{ 
-            position: fixed; 
-            top: 20px; 
-            right: 20px; 
-            background: var(--accent);
-            color: white; 
-            width: 50px;
-            height: 50px;
-            border-radius: 50%;
-            text-decoration: none; 
-            z-index: 1000;
-            box-shadow: 0 4px 20px rgba(6, 182, 212, 0.4);
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            font-size: 24px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-        
-        .home-btn:hover {{ 
-            background: #0891b2;
-            transform: translateY(-2px);
-            box-shadow: 0 8px 30px rgba(6, 182, 212, 0.5);
-        }}
-        
-        .breadcrumb {{ 
-            background: var(--bg-card);
-            padding: 12px 0; 
-            margin-bottom: 24px; 
-            font-size: 14px;
-            border-radius: 8px;
-            border: 1px solid var(--border);
-        }}
-        
-        .breadcrumb a {{ 
-            color: var(--accent);
-            text-decoration: none;
-            transition: color 0.2s;
-        }}
-        
-        .breadcrumb a:hover {{ 
-            color: var(--primary);
-            text-decoration: underline;
-        }}
-        
-        .content {{ 
-            background: var(--bg-card);
-            padding: 3rem; 
-            border-radius: 16px; 
-            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
-            border: 1px solid var(--border);
-        }}
-        
-        .file-list {{ 
-            display: grid; 
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr)); 
-            gap: 1.5rem; 
-            margin: 2rem 0; 
-        }}
-        
-        .file-item {{ 
-            padding: 1.5rem; 
-            border: 1px solid var(--border);
-            border-radius: 12px; 
-            background: var(--bg-main);
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .file-item::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 3px;
-            background: linear-gradient(90deg, var(--primary), var(--secondary));
-            opacity: 0;
-            transition: opacity 0.3s;
-        }}
-        
-        .file-item:hover {{ 
-            transform: translateY(-4px); 
-            box-shadow: 0 8px 30px rgba(99, 102, 241, 0.3);
-            border-color: var(--primary);
-        }}
-        
-        .file-item:hover::before {{
-            opacity: 1;
-        }}
-        
-        .file-item a {{ 
-            color: var(--text-primary);
-            text-decoration: none; 
-            font-weight: 600; 
-            display: block;
-            font-size: 1.1rem;
-        }}
-        
-        .file-item a:hover {{ 
-            color: var(--primary);
-        }}
-        
-        .file-type {{ 
-            font-size: 13px; 
-            color: var(--text-secondary);
-            margin-top: 8px; 
-            font-weight: 500;
-        }}
-        
-        /* Code Blocks */
-        pre {{ 
-            background: var(--bg-code);
-            padding: 1.5rem; 
-            border-radius: 12px; 
-            overflow-x: auto;
-            border: 1px solid var(--border);
-            margin: 1.5rem 0;
-            box-shadow: 0 4px 10px rgba(0, 0, 0, 0.3);
-            position: relative;
-        }}
-        
-        pre code {{ 
-            background: none;
-            padding: 0;
-            font-family: 'Fira Code', 'Consolas', monospace;
-            font-size: 0.9em;
-            line-height: 1.6;
-        }}
-        
-        /* Copy Button */
-        .copy-btn {{
-            position: absolute;
-            top: 8px;
-            right: 8px;
-            background: var(--primary);
-            color: white;
-            border: none;
-            padding: 6px 12px;
-            border-radius: 6px;
-            cursor: pointer;
-            font-size: 12px;
-            font-weight: 600;
-            transition: all 0.2s;
-            opacity: 0.7;
-            z-index: 10;
-        }}
-        
-        .copy-btn:hover {{
-            opacity: 1;
-            background: var(--primary-dark);
-            transform: translateY(-1px);
-        }}
-        
-        .copy-btn.copied {{
-            background: var(--success);
-        }}
-        
-        pre:hover .copy-btn {{
-            opacity: 1;
-        }}
-        
-        /* Inline Code */
-        code {{ 
-            background: var(--bg-code);
-            color: #8b5cf6;
-            padding: 3px 8px; 
-            border-radius: 6px; 
-            font-size: 1.1em;
-            font-family: 'Fira Code', 'Consolas', monospace;
-            border: 1px solid var(--border);
-        }}
-        
-        /* Headings */
-        h1, h2, h3, h4, h5, h6 {{ 
-            color: var(--text-primary);
-            margin: 2rem 0 1rem 0;
-            font-weight: 700;
-            letter-spacing: -0.5px;
-        }}
-        
-        h1 {{ 
-            font-size: 2.5rem;
-            background: linear-gradient(135deg, var(--primary), var(--secondary));
-            -webkit-background-clip: text;
-            border-bottom: 3px solid var(--primary);
-            padding-bottom: 12px;
-            margin-bottom: 1.5rem;
-        }}
-        
-        h2 {{ 
-            font-size: 2rem;
-            color: var(--primary);
-            border-bottom: 2px solid var(--border);
-            padding-bottom: 8px;
-        }}
-        
-        h3 {{ 
-            font-size: 1.5rem;
-            color: var(--accent);
-        }}
-        
-        /* Links */
-        a {{ 
-            color: var(--accent);
-            transition: color 0.2s;
-        }}
-        
-        a:hover {{ 
-            color: var(--primary);
-        }}
-        
-        /* Paragraphs */
-        p {{
-            margin: 1rem 0;
-            color: var(--text-secondary);
-        }}
-        
-        /* Lists */
-        ul, ol {{
-            margin: 1rem 0;
-            padding-left: 2rem;
-            color: var(--text-secondary);
-        }}
-        
-        li {{
-            margin: 0.5rem 0;
-        }}
-        
-        /* Tables */
-        table {{ 
-            border-collapse: collapse;
-            width: 100%;
-            margin: 1.5rem 0;
-            background: var(--bg-main);
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.2);
-        }}
-        
-        th, td {{ 
-            border: 1px solid var(--border);
-            padding: 12px 16px;
-            text-align: left;
-        }}
-        
-        th {{ 
-            background: linear-gradient(135deg, var(--primary), var(--secondary));
-            color: white;
-            font-weight: 600;
-        }}
-        
-        tr:hover {{
-            background: var(--bg-card);
-        }}
-        
-        /* Blockquotes */
-        blockquote {{
-            border-left: 4px solid var(--primary);
-            padding: 1rem 1.5rem;
-            margin: 1.5rem 0;
-            background: var(--bg-main);
-            border-radius: 0 8px 8px 0;
-            color: var(--text-secondary);
-            font-style: italic;
-        }}
-        
-        /* Horizontal Rule */
-        hr {{
-            border: none;
-            border-top: 2px solid var(--border);
-            margin: 2rem 0;
-        }}
-        
-        .footer {{ 
-            text-align: center; 
-            padding: 2rem; 
-            color: var(--text-secondary);
-            border-top: 1px solid var(--border);
-            margin-top: 3rem; 
-            font-size: 14px;
-        }}
-        
-        /* Scrollbar */
-        ::-webkit-scrollbar {{
-            width: 12px;
-            height: 12px;
-        }}
-        
-        ::-webkit-scrollbar-track {{
-            background: var(--bg-main);
-        }}
-        
-        ::-webkit-scrollbar-thumb {{
-            background: var(--border);
-            border-radius: 6px;
-        }}
-        
-        ::-webkit-scrollbar-thumb:hover {{
-            background: var(--primary);
-        }}
-        
-        @media (max-width: 768px) {{
-            .container {{ padding: 10px; }}
-            .file-list {{ grid-template-columns: 1fr; }}
-            .content {{ padding: 1.5rem; }}
-            h1 {{ font-size: 2rem; }}
-            h2 {{ font-size: 1.5rem; }}
-        }}
-    </style>
-</head>
+    <title>$title</title>
+    <link rel="stylesheet" href="$assets_root/site.css">
+"""
+
+_HTML_BODY = """</head>
 <body>
-    <a href="{home_path}" class="home-btn">🏠</a>
+    <a href="$home_path" class="home-btn">🏠</a>
     <div class="container">
         <div class="breadcrumb">
             <div style="padding: 0 20px;">
-                {breadcrumb}
+                $breadcrumb
             </div>
         </div>
         <div class="content">
-            {content}
+            $content
         </div>
         <div class="footer">
-            Generated on {timestamp} | Made with ❤️ by GitHub Pages Generator
+            Generated on $timestamp | Made with ❤️ by GitHub Pages Generator
         </div>
     </div>
-    <script>
-        // Syntax highlighting for code blocks
-        document.addEventListener('DOMContentLoaded', (event) => {{
-            // Highlight code blocks
-            document.querySelectorAll('pre code').forEach((block) => {{
-                hljs.highlightElement(block);
-            }});
-            
-            // Add copy buttons to code blocks
-            document.querySelectorAll('pre').forEach((pre) => {{
-                const button = document.createElement('button');
-                button.className = 'copy-btn';
-                button.textContent = 'Copy';
-                
-                button.addEventListener('click', () => {{
-                    const code = pre.querySelector('code').textContent;
-                    navigator.clipboard.writeText(code).then(() => {{
-                        button.textContent = 'Copied!';
-                        button.classList.add('copied');
-                        setTimeout(() => {{
-                            button.textContent = 'Copy';
-                            button.classList.remove('copied');
-                        }}, 2000);
-                    }}).catch(err => {{
-                        console.error('Failed to copy:', err);
-                        button.textContent = 'Error';
-                        setTimeout(() => {{
-                            button.textContent = 'Copy';
-                        }}, 2000);
-                    }});
-                }});
-                
-                pre.appendChild(button);
-            }});
-        }});
-    </script>
-</body>
-</html>"""
-
-    def create_breadcrumb(self, current_path):
-        """Create breadcrumb navigation with relative paths"""
-        path_to_root = self.get_relative_path_to_root(current_path)
+"""
 
-        # Home link is always relative to root
-        breadcrumb = f'<a href="{path_to_root}/index.html">🏠 Home</a>'
+_PAGE_TMPL = (
+    _HTML_HEAD
+    + '    <link rel="stylesheet" href="$assets_root/pygments.css">\n'
+    + _HTML_BODY
+    + '    <script src="$assets_root/site.js"></script>\n'
+    + "</body>\n</html>"
+)
+
+_INDEX_TMPL = _HTML_HEAD + _HTML_BODY + "</body>\n</html>"
+
+# Build-time syntax highlighting; styles are written to assets/pygments.css
+_PYGMENTS_STYLE = "github-dark"
+_CODE_CSS_CLASS = "hljs"
+_CODE_FORMATTER = HtmlFormatter(cssclass=_CODE_CSS_CLASS, wrapcode=True)
+# Plain fenced code blocks; cmark's <pre lang="x"><code> form is matched too
+_CODE_BLOCK_RE = re.compile(
+    r'<pre(?: lang="([^"]+)")?><code(?: class="language-([^"]+)")?>(.*?)</code></pre>',
+    re.DOTALL,
+)
+
+# Headings without attributes, for the toc-style id post-pass
+_HEADING_RE = re.compile(r"<h([1-6])>(.*?)</h\1>", re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Version of the generated HTML, part of the build fingerprint and of every
+# render cache key (via _markdown_backend_id). Bump it with any change to the
+# output: templates, listing or breadcrumb markup, the
+# highlight and heading-id post-passes, or the Pygments formatter options.
+_GENERATOR_VERSION = "1"
+
+# Progress lines are written to stdout in batches of this size
+_LOG_BATCH = 64
+
+# Per-process render state, set up once per worker by _init_worker()
+_worker = {}
+
+
+def _highlight_code_blocks(html_text):
+    """Highlight plain <pre><code> blocks with Pygments, like codehilite does"""
+
+    def highlight_block(match):
+        pre_lang, code_lang, code = match.groups()
+        lang = code_lang or pre_lang
+        try:
+            lexer = get_lexer_by_name(lang) if lang else TextLexer()
+        except ClassNotFound:
+            lexer = TextLexer()
+        return highlight(unescape(code), lexer, _CODE_FORMATTER)
+
+    return _CODE_BLOCK_RE.sub(highlight_block, html_text)
+
+
+def _add_heading_ids(html_text):
+    """Give headings the same ids the python-markdown toc extension adds"""
+    used_ids = set()
+
+    def add_id(match):
+        level, inner = match.groups()
+        heading_id = unique(slugify(unescape(_TAG_RE.sub("", inner)), "-"), used_ids)
+        return f'<h{level} id="{heading_id}">{inner}</h{level}>'
+
+    return _HEADING_RE.sub(add_id, html_text)
+
+
+def _create_markdown_backend(extensions, extension_configs=None):
+    """Build the fastest available markdown-to-HTML callable, once per process.
+
+    Returns ``(name, convert)``: the parser name and version, used to key the
+    render cache, and the callable itself, so the key always describes the
+    parser in use. Every backend emits ``<pre><code class="language-x">`` for
+    fenced code and toc-style heading ids, so pages match whichever parser is
+    installed.
+    """
+    if cmarkgfm is not None:
+        # github_flavored_markdown_to_html() forces CMARK_OPT_GITHUB_PRE_LANG
+        # (``<pre lang="x">``), so the GFM extensions are enabled directly.
+        # Raw HTML in the docs is kept, as with python-markdown.
+        return (
+            f"cmarkgfm {package_version('cmarkgfm')}",
+            lambda text: _highlight_code_blocks(
+                _add_heading_ids(
+                    cmarkgfm.markdown_to_html_with_extensions(
+                        text,
+                        options=cmarkgfmOptions.CMARK_OPT_UNSAFE,
+                        extensions=["table", "autolink", "strikethrough", "tasklist"],
+                    )
+                )
+            ),
+        )
+
+    if mistune is not None:
+        parse = mistune.create_markdown(
+            escape=False,
+            plugins=["table", "url", "strikethrough", "footnotes"],
+        )
+        return (
+            f"mistune {package_version('mistune')}",
+            lambda text: _highlight_code_blocks(_add_heading_ids(parse(text))),
+        )
+
+    # One Markdown instance per process; reset() clears per-document state
+    md = markdown.Markdown(
+        extensions=extensions,
+        extension_configs=extension_configs or {},
+        output_format="html",
+    )
+    return f"markdown {package_version('markdown')}", lambda text: md.reset().convert(
+        text
+    )
+
+
+def _markdown_backend_id(backend_name, extensions, extension_configs):
+    """Describe the renderer configuration; part of every render cache key"""
+    return (
+        f"{_GENERATOR_VERSION}|{backend_name}|pygments {package_version('pygments')}"
+        f"|{extensions!r}|{extension_configs!r}"
+    )
+
+
+def _init_worker(extensions, extension_configs, timestamp, cache_dir, md_backend=None):
+    """Build the page template and markdown parser once per worker process"""
+    _worker["tmpl"] = string.Template(_PAGE_TMPL)
+    backend_name, _worker["md"] = md_backend or _create_markdown_backend(
+        extensions, extension_configs
+    )
+    _worker["timestamp"] = timestamp
+
+    # Rendered markdown keyed by content hash: in memory, then on disk
+    _worker["md_cache"] = {}
+    _worker["cache_dir"] = cache_dir
+    _worker["cache_hash"] = hashlib.blake2b(
+        _markdown_backend_id(backend_name, extensions, extension_configs).encode(
+            "utf-8"
+        ),
+        digest_size=16,
+    )
+
+
+def _convert_cached(content_bytes):
+    """Convert markdown to HTML, reusing earlier output for identical sources.
+
+    Returns ``(key, html)``; the key names the cache entry that was used.
+    """
+    cache_hash = _worker["cache_hash"].copy()
+    cache_hash.update(content_bytes)
+    key = cache_hash.hexdigest()
+
+    html_content = _worker["md_cache"].get(key)
+    if html_content is not None:
+        return key, html_content
+
+    cache_file = os.path.join(_worker["cache_dir"], f"{key}.html")
+    try:
+        with open(cache_file, "rb") as f:
+            html_content = f.read().decode("utf-8")
+    except OSError:
+        html_content = _worker["md"](content_bytes.decode("utf-8", errors="ignore"))
+
+        # Write then rename, so a concurrent worker never reads a partial file.
+        # A cache that cannot be written only costs a re-render next time.
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(html_content.encode("utf-8"))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+    _worker["md_cache"][key] = html_content
+    return key, html_content
+
+
+def _render_md(md_path, stem, breadcrumb, path_to_root):
+    """Convert one markdown file (given as a str path) to a full HTML page.
+
+    Returns ``(cache_key, page)``.
+    """
+    with open(md_path, "rb") as f:
+        content_bytes = f.read()
+
+    key, html_content = _convert_cached(content_bytes)
+    return key, _worker["tmpl"].substitute(
+        title=stem,
+        breadcrumb=breadcrumb,
+        content=html_content,
+        timestamp=_worker["timestamp"],
+        home_path=f"{path_to_root}/index.html",
+        assets_root=f"{path_to_root}/assets",
+    )
+
+
+def _render_job(job):
+    """Render a queued file, returning the error instead of raising it.
 
-        if current_path == Path("."):
+    The page comes back already UTF-8 encoded, so encoding happens in the
+    workers and the main process only writes bytes to disk.
+    """
+    rel_file_path, md_path, stem, output_file, breadcrumb, path_to_root = job
+    try:
+        key, page = _render_md(md_path, stem, breadcrumb, path_to_root)
+        return rel_file_path, output_file, key, page.encode("utf-8"), None
+    except Exception as e:
+        return rel_file_path, output_file, None, None, str(e)
+
+
+class FastSiteGenerator:
+    def __init__(
+        self,
+        source_dir=".",
+        output_dir="docs",
+        workers=None,
+        incremental=True,
+        verbose=True,
+    ):
+        self.source_dir = Path(source_dir)
+        self.output_dir = Path(output_dir)
+        # Rendered markdown by content hash, in a hidden directory next to the
+        # output: outside the published site and skipped by the walker
+        self.cache_dir = self.output_dir.parent / f".{self.output_dir.name}-cache"
+        # Only re-render pages whose source is newer than the existing output
+        self.incremental = incremental
+        # Number of render processes; None uses every CPU, 1 renders in-process
+        self.workers = workers
+        # Print a line per page/index; otherwise only errors and the summary
+        self.verbose = verbose
+        self.markdown_extensions = ["toc", "tables", "fenced_code", "codehilite"]
+        # Highlight code with Pygments at build time; no client-side highlighter
+        self.markdown_extension_configs = {
+            "codehilite": {
+                "pygments_style": _PYGMENTS_STYLE,
+                "css_class": _CODE_CSS_CLASS,
+                "guess_lang": False,
+            }
+        }
+        # (name, convert) of the markdown parser, built on first use by
+        # _markdown_backend(); workers=1 renders with it in-process
+        self._md_backend = None
+
+        # Parse the index template once; every index is a substitute() call.
+        # Pages use the per-worker template set up by _init_worker().
+        self._index_tmpl = string.Template(_INDEX_TMPL)
+
+        # Breadcrumb HTML per directory, shared by its index and every page in it
+        self._breadcrumb_cache = {}
+
+        # Progress lines waiting to be written by _flush_log()
+        self._log_lines = []
+
+        # Create output directory
+        self.output_dir.mkdir(exist_ok=True)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _root_rel(depth):
+        """Relative path from a directory `depth` levels deep back to root"""
+        return "/".join([".."] * depth) if depth > 0 else "."
+
+    def create_breadcrumb(self, rel_dir):
+        """Create breadcrumb navigation with relative paths"""
+        breadcrumb = self._breadcrumb_cache.get(rel_dir)
+        if breadcrumb is not None:
             return breadcrumb
 
-        parts = current_path.parts
+        parts = rel_dir.split(os.sep) if rel_dir else []
+        path_to_root = self._root_rel(len(parts))
+
+        # Home link is always relative to root
+        segments = [f'<a href="{path_to_root}/index.html">🏠 Home</a>']
+
         for i, part in enumerate(parts):
             # Calculate how many levels to go up from current location
             levels_up = len(parts) - i - 1
             if levels_up > 0:
-                path = "/".join([".."] * levels_up) + "/index.html"
+                path = f"{self._root_rel(levels_up)}/index.html"
             else:
                 path = "index.html"
 
-            breadcrumb += (
-                f' <span style="color: #64748b;">/</span> <a href="{path}">{part}</a>'
+            segments.append(
+                f'<span style="color: #64748b;">/</span> <a href="{path}">{part}</a>'
             )
 
+        breadcrumb = " ".join(segments)
+        self._breadcrumb_cache[rel_dir] = breadcrumb
         return breadcrumb
 
-    def format_markdown_file(self, md_path):
-        """Format markdown file using Prettier via npx"""
-        # PRETTIER DISABLED - Skip formatting
-        return True
+    def _listing_signature(self, subdirs, files):
+        """Structural key of a listing: (name, is_dir) pairs, directories first"""
+        return tuple((entry.name, True) for entry in subdirs) + tuple(
+            (entry.name, False) for entry in files
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _render_listing_html(signature, title):
+        """Build the listing body; repeated (signature, title) pairs are cached"""
+        parts = [
+            f"<h1>📚 {title.replace('_', ' ').replace('-', ' ').title()}</h1>",
+            "<p style='color: #94a3b8; margin-bottom: 2rem;'>Browse through the available documentation files and folders.</p>",
+        ]
 
-    def process_markdown(self, md_path, relative_path):
-        """Convert markdown to HTML"""
-        # Format markdown with Prettier first
-        self.format_markdown_file(md_path)
+        if signature:
+            parts.append('<div class="file-list">')
 
-        with open(md_path, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
+            # Directories come first in the signature, then files
+            for name, is_dir in signature:
+                if is_dir:
+                    parts.append(
+                        _FILE_ITEM_TMPL.format(
+                            f"{name}/index.html", f"{name}/", "📁 Directory"
+                        )
+                    )
+                else:
+                    stem, _, suffix = name.rpartition(".")
+                    parts.append(
+                        _FILE_ITEM_TMPL.format(
+                            f"{stem}.html", name, f"📄 .{suffix.upper()} File"
+                        )
+                    )
 
-        md = markdown.Markdown(extensions=self.markdown_extensions)
-        html_content = md.convert(content)
+            parts.append("</div>")
+        else:
+            parts.append(
+                '<p style="color: #64748b;">No files found in this directory.</p>'
+            )
 
-        # Calculate path to root for home button
-        parent_path = relative_path.parent
-        path_to_root = self.get_relative_path_to_root(parent_path)
-        home_path = f"{path_to_root}/index.html"
+        return "".join(parts)
 
-        # Create breadcrumb
-        breadcrumb = self.create_breadcrumb(parent_path)
+    def create_directory_listing(
+        self, rel_dir, signature, breadcrumb, path_to_root, timestamp
+    ):
+        """Create directory listing page with relative paths"""
+        name = os.path.basename(rel_dir)
+
+        # Breadcrumb and home path are per directory, so they stay out of the cache
+        content = self._render_listing_html(signature, name or "Documentation")
 
-        # Generate HTML
-        html = self.get_html_template().format(
-            title=md_path.stem,
+        html = self._index_tmpl.substitute(
+            title=name or "Home",
             breadcrumb=breadcrumb,
-            content=html_content,
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            home_path=home_path,
+            content=content,
+            timestamp=timestamp,
+            home_path=f"{path_to_root}/index.html",
+            assets_root=f"{path_to_root}/assets",
         )
 
         return html
 
-    def create_directory_listing(self, dir_path, relative_path):
-        """Create directory listing page with relative paths"""
+    def _walk(self, dir_path, rel_dir="", depth=0):
+        """Yield (dir_path, rel_dir, depth, subdirs, files) top-down.
+
+        Each directory is read with a single os.scandir() call; the DirEntry
+        type information is reused for both rendering and the index page.
+        Hidden entries and the output directory are skipped, and only
+        markdown/text files are returned in ``files``. Paths are plain
+        strings (``rel_dir`` is "" at the root) and ``depth`` is the recursion
+        level, so the hot loop allocates no Path objects.
+        """
+        subdirs = []
         files = []
-        dirs = []
+        output_name = self.output_dir.name
 
-        for item in sorted(dir_path.iterdir()):
-            if item.name.startswith(".") or item.name == self.output_dir.name:
-                continue
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith(".") or name == output_name:
+                        continue
+
+                    if entry.is_dir():
+                        subdirs.append(entry)
+                    elif name[name.rfind(".") :].lower() in _DOC_SUFFIXES:
+                        files.append(entry)
+        except OSError as e:
+            self._log(f"⚠️ Error reading directory {rel_dir or '.'}: {e}")
+            return
+
+        subdirs.sort(key=lambda entry: entry.name)
+        files.sort(key=lambda entry: entry.name)
+
+        yield dir_path, rel_dir, depth, subdirs, files
 
-            if item.is_dir():
-                # Relative path to subdirectory
-                dirs.append(
-                    {
-                        "name": item.name,
-                        "path": f"{item.name}/index.html",
-                        "type": "📁 Directory",
-                    }
+        for entry in subdirs:
+            # Like os.walk, don't descend into symlinked directories
+            if not entry.is_symlink():
+                yield from self._walk(
+                    entry.path, os.path.join(rel_dir, entry.name), depth + 1
                 )
-            elif item.suffix.lower() in [".md", ".txt"]:
-                # Relative path to file
-                files.append(
-                    {
-                        "name": item.name,
-                        "path": f"{item.stem}.html",
-                        "type": f"📄 {item.suffix.upper()} File",
-                    }
+
+    def _is_up_to_date(self, entry, output_file):
+        """Check whether an output page is at least as new as its source"""
+        try:
+            return os.stat(output_file).st_mtime >= entry.stat().st_mtime
+        except FileNotFoundError:
+            return False
+
+    def _listing_digest(self, signature):
+        """Hash the (name, is_dir) entries an index page is built from"""
+        return hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()
+
+    def _read_digest(self, digest_file):
+        """Return the listing digest stored by a previous run, if any"""
+        try:
+            with open(digest_file, "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _markdown_backend(self):
+        """Return this process's (name, convert) markdown backend"""
+        if self._md_backend is None:
+            self._md_backend = _create_markdown_backend(
+                self.markdown_extensions, self.markdown_extension_configs
+            )
+        return self._md_backend
+
+    def _build_fingerprint(self):
+        """Hash the generator version, renderer and templates of the output"""
+        return hashlib.sha1(
+            "\0".join(
+                [
+                    _markdown_backend_id(
+                        self._markdown_backend()[0],
+                        self.markdown_extensions,
+                        self.markdown_extension_configs,
+                    ),
+                    _PAGE_TMPL,
+                    _INDEX_TMPL,
+                    _FILE_ITEM_TMPL,
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _log(self, line):
+        """Queue a progress line; stdout is written once per _LOG_BATCH lines"""
+        self._log_lines.append(line)
+        if len(self._log_lines) >= _LOG_BATCH:
+            self._flush_log()
+
+    def _flush_log(self):
+        """Write any queued progress lines to stdout"""
+        if self._log_lines:
+            sys.stdout.write("\n".join(self._log_lines) + "\n")
+            self._log_lines.clear()
+        sys.stdout.flush()
+
+    def _discover(self):
+        """Phase 1: walk the source tree once.
+
+        Returns ``(all_dirs, md_jobs, skipped)``: one entry per output
+        directory (with everything its index page needs), one render job per
+        page that is out of date, and the source paths of up-to-date pages.
+        Hidden and output directories are already excluded by the walker.
+        """
+        all_dirs = []
+        md_jobs = []
+        skipped = []
+        output_root = str(self.output_dir)
+        for dir_path, rel_dir, depth, subdirs, files in self._walk(
+            str(self.source_dir)
+        ):
+            output_dir_path = (
+                os.path.join(output_root, rel_dir) if depth else output_root
+            )
+
+            # Path to root and breadcrumb are shared by every page in the directory
+            path_to_root = self._root_rel(depth)
+            breadcrumb = self.create_breadcrumb(rel_dir)
+
+            # Queue markdown and text files
+            for entry in files:
+                name = entry.name
+                rel_file_path = os.path.join(rel_dir, name) if depth else name
+                stem = name.rsplit(".", 1)[0]
+                output_file = os.path.join(output_dir_path, f"{stem}.html")
+                if self.incremental and self._is_up_to_date(entry, output_file):
+                    skipped.append(rel_file_path)
+                    continue
+
+                md_jobs.append(
+                    (
+                        rel_file_path,
+                        entry.path,
+                        stem,
+                        output_file,
+                        breadcrumb,
+                        path_to_root,
+                    )
                 )
 
-        # Create content
-        title = relative_path.name if relative_path.name else "Documentation"
-        content = f"<h1>📚 {title.replace('_', ' ').replace('-', ' ').title()}</h1>"
-        content += f"<p style='color: #94a3b8; margin-bottom: 2rem;'>Browse through the available documentation files and folders.</p>"
-
-        if dirs or files:
-            content += '<div class="file-list">'
-
-            # Directories first
-            for dir_info in dirs:
-                content += f"""
-                <div class="file-item">
-                    <a href="{dir_info['path']}">{dir_info['name']}/</a>
-                    <div class="file-type">{dir_info['type']}</div>
-                </div>"""
-
-            # Then files
-            for file_info in files:
-                content += f"""
-                <div class="file-item">
-                    <a href="{file_info['path']}">{file_info['name']}</a>
-                    <div class="file-type">{file_info['type']}</div>
-                </div>"""
-
-            content += "</div>"
-        else:
-            content += (
-                '<p style="color: #64748b;">No files found in this directory.</p>'
+            all_dirs.append(
+                (
+                    rel_dir,
+                    output_dir_path,
+                    self._listing_signature(subdirs, files),
+                    breadcrumb,
+                    path_to_root,
+                )
             )
 
-        # Calculate path to root for home button
-        path_to_root = self.get_relative_path_to_root(relative_path)
-        home_path = f"{path_to_root}/index.html"
+        return all_dirs, md_jobs, skipped
 
-        breadcrumb = self.create_breadcrumb(relative_path)
+    def _make_dirs(self, all_dirs):
+        """Phase 2: create every output directory before rendering starts"""
+        # The walk is top-down, so every parent is created before its children;
+        # the first entry is the output root, which already exists
+        for _, output_dir_path, _, _, _ in all_dirs[1:]:
+            try:
+                os.mkdir(output_dir_path)
+            except FileExistsError:
+                pass
 
-        html = self.get_html_template().format(
-            title=relative_path.name if relative_path.name else "Home",
-            breadcrumb=breadcrumb,
-            content=content,
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            home_path=home_path,
-        )
+    def _render_pages(self, md_jobs):
+        """Phase 3: render pages; each file is independent, so use processes.
 
-        return html
+        Returns ``{rel_file_path: cache_key}`` for the pages written.
+        """
+        init_args = (
+            self.markdown_extensions,
+            self.markdown_extension_configs,
+            self._timestamp,
+            str(self.cache_dir),
+        )
+        if self.workers == 1:
+            # Render in this process, reusing the parser across runs
+            _init_worker(*init_args, md_backend=self._markdown_backend())
+            return self._write_pages(map(_render_job, md_jobs), len(md_jobs))
 
-    def generate_site(self):
-        """Generate the complete static site"""
-        print("🚀 Starting fast site generation...")
+        if md_jobs:
+            with ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=init_args
+            ) as executor:
+                return self._write_pages(
+                    executor.map(_render_job, md_jobs, chunksize=16), len(md_jobs)
+                )
 
-        # Clean output directory
-        if self.output_dir.exists():
-            shutil.rmtree(self.output_dir)
-        self.output_dir.mkdir()
+        return {}
 
-        # Create .nojekyll file for GitHub Pages
-        (self.output_dir / ".nojekyll").touch()
+    def _write_pages(self, results, total):
+        """Write rendered pages in walk order as they come back from the renderer"""
+        written = {}
+        for count, (rel_file_path, output_file, key, page_bytes, error) in enumerate(
+            results, 1
+        ):
+            if error is not None:
+                self._log(f"⚠️ Error processing {rel_file_path}: {error}")
+                continue
 
-        # Process all directories and files
-        for root, dirs, files in os.walk(self.source_dir):
-            root_path = Path(root)
+            try:
+                with open(output_file, "wb") as f:
+                    f.write(page_bytes)
+                written[rel_file_path] = key
+                if self.verbose:
+                    self._log(f"✅ [{count}/{total}] {rel_file_path}")
+            except Exception as e:
+                self._log(f"⚠️ Error processing {rel_file_path}: {e}")
 
-            # Calculate relative path
-            if root_path == self.source_dir:
-                relative_path = Path(".")
-            else:
-                relative_path = root_path.relative_to(self.source_dir)
+        self._flush_log()
+        return written
 
-            # Skip hidden directories and output directory
-            if any(
-                part.startswith(".") or part == self.output_dir.name
-                for part in relative_path.parts
+    def _write_indexes(self, all_dirs):
+        """Phase 4: write directory index pages; returns (written, unchanged)"""
+        written = 0
+        skipped = 0
+        total = len(all_dirs)
+        for count, (
+            rel_dir,
+            output_dir_path,
+            signature,
+            breadcrumb,
+            path_to_root,
+        ) in enumerate(all_dirs, 1):
+            index_file = os.path.join(output_dir_path, "index.html")
+            digest_file = os.path.join(output_dir_path, ".idx.sha1")
+            digest = self._listing_digest(signature)
+            if (
+                self.incremental
+                and os.path.exists(index_file)
+                and self._read_digest(digest_file) == digest
             ):
+                skipped += 1
                 continue
 
-            # Skip the output directory itself
-            if root_path == self.output_dir or self.output_dir in root_path.parents:
+            try:
+                dir_html = self.create_directory_listing(
+                    rel_dir,
+                    signature,
+                    breadcrumb,
+                    path_to_root,
+                    self._timestamp,
+                )
+                with open(index_file, "wb") as f:
+                    f.write(dir_html.encode("utf-8"))
+                with open(digest_file, "w", encoding="utf-8") as f:
+                    f.write(digest)
+
+                written += 1
+                if self.verbose:
+                    self._log(f"📂 [{count}/{total}] {rel_dir or '.'}/")
+            except Exception as e:
+                self._log(
+                    f"⚠️ Error creating directory listing for {rel_dir or '.'}: {e}"
+                )
+
+        self._flush_log()
+        return written, skipped
+
+    def _prune_stale(self, all_dirs):
+        """Phase 5: remove pages and directories whose source no longer exists.
+
+        Only generated names are considered: ``.html`` files and directories.
+        Hidden entries (digests, ``.nojekyll``) and the root ``assets``
+        directory are kept. Returns the number of entries removed.
+        """
+        removed = 0
+        output_root = str(self.output_dir)
+        for rel_dir, output_dir_path, signature, _, _ in all_dirs:
+            expected = {"index.html"}
+            for name, is_dir in signature:
+                expected.add(name if is_dir else f"{name.rsplit('.', 1)[0]}.html")
+            if output_dir_path == output_root:
+                expected.add("assets")
+
+            try:
+                with os.scandir(output_dir_path) as it:
+                    stale = [
+                        entry
+                        for entry in it
+                        if not entry.name.startswith(".")
+                        and entry.name not in expected
+                        and (entry.is_dir() or entry.name.endswith(".html"))
+                    ]
+            except OSError:
                 continue
 
-            output_dir_path = (
-                self.output_dir / relative_path
-                if relative_path != Path(".")
-                else self.output_dir
-            )
-            output_dir_path.mkdir(parents=True, exist_ok=True)
+            for entry in stale:
+                rel_path = os.path.join(rel_dir, entry.name)
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.remove(entry.path)
+                    removed += 1
+                    if self.verbose:
+                        self._log(f"🗑️ Removed {rel_path}")
+                except OSError as e:
+                    self._log(f"⚠️ Error removing {rel_path}: {e}")
 
-            # Process markdown and text files
-            for file in files:
-                if file.startswith("."):
-                    continue
+        self._flush_log()
+        return removed
 
-                file_path = root_path / file
-                rel_file_path = (
-                    relative_path / file if relative_path != Path(".") else Path(file)
-                )
+    def _prune_cache(self, skipped, written):
+        """Phase 6: drop cache entries that no current page was rendered from.
 
-                if file.lower().endswith((".md", ".txt")):
-                    try:
-                        html_content = self.process_markdown(file_path, rel_file_path)
-                        output_file = output_dir_path / f"{Path(file).stem}.html"
+        A manifest maps each page to its entry; up-to-date pages keep the
+        entry recorded by an earlier run.
+        """
+        if not self.cache_dir.is_dir():
+            return
 
-                        with open(output_file, "w", encoding="utf-8") as f:
-                            f.write(html_content)
+        manifest_file = self.cache_dir / "manifest.json"
+        try:
+            with open(manifest_file, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            previous = {}
 
-                        print(f"✅ {rel_file_path}")
-                    except Exception as e:
-                        print(f"⚠️ Error processing {rel_file_path}: {e}")
+        manifest = {rel: previous[rel] for rel in skipped if rel in previous}
+        manifest.update(written)
 
-            # Create directory listing
-            try:
-                dir_html = self.create_directory_listing(root_path, relative_path)
-                index_file = output_dir_path / "index.html"
+        # Everything else (old entries, leftover .tmp files) is stale
+        live = {f"{key}.html" for key in manifest.values()}
+        live.update({manifest_file.name, ".gitignore"})
+        try:
+            with open(manifest_file, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=0, sort_keys=True)
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name not in live and entry.is_file():
+                        os.remove(entry.path)
+        except OSError as e:
+            print(f"⚠️ Could not prune render cache {self.cache_dir}: {e}")
+
+    def generate_site(self):
+        """Generate the complete static site"""
+        print("🚀 Starting fast site generation...")
 
-                with open(index_file, "w", encoding="utf-8") as f:
-                    f.write(dir_html)
+        # One timestamp for the whole run instead of one per page
+        self._timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-                print(f"📂 {relative_path}/")
-            except Exception as e:
-                print(f"⚠️ Error creating directory listing for {relative_path}: {e}")
+        # Clean output directory, unless only changed pages are rebuilt.
+        # Output built by other templates or another renderer is rebuilt too.
+        fingerprint_file = self.output_dir / ".build.sha1"
+        fingerprint = self._build_fingerprint()
+        rebuild = (
+            not self.incremental or self._read_digest(fingerprint_file) != fingerprint
+        )
+        if rebuild:
+            # Cached page bodies are dropped too, so --force renders from scratch
+            if self.output_dir.exists():
+                shutil.rmtree(self.output_dir)
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self.output_dir.mkdir(exist_ok=True)
+
+        # Create .nojekyll file for GitHub Pages
+        (self.output_dir / ".nojekyll").touch()
+
+        # Shared CSS/JS, linked from every page instead of inlined
+        assets_dir = self.output_dir / "assets"
+        assets_dir.mkdir(exist_ok=True)
+        (assets_dir / "site.css").write_bytes(_CSS.encode("utf-8"))
+        (assets_dir / "site.js").write_bytes(_JS.encode("utf-8"))
+        pygments_css = HtmlFormatter(style=_PYGMENTS_STYLE).get_style_defs(
+            f".{_CODE_CSS_CLASS}"
+        )
+        (assets_dir / "pygments.css").write_bytes(pygments_css.encode("utf-8"))
+
+        # Rendered markdown by content hash, reused across pages and runs;
+        # the .gitignore keeps the cache out of commits. Without a writable
+        # cache every page is still rendered, just never reused.
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            (self.cache_dir / ".gitignore").write_bytes(b"*\n")
+        except OSError as e:
+            print(f"⚠️ Render cache unavailable at {self.cache_dir}: {e}")
+
+        # discover -> mkdir -> render pages -> render indexes -> prune -> cache
+        all_dirs, md_jobs, skipped = self._discover()
+        self._flush_log()
+        print(f"🔍 {len(all_dirs)} directories, {len(md_jobs)} pages to render")
+
+        self._make_dirs(all_dirs)
+        page_keys = self._render_pages(md_jobs)
+        indexes_written, indexes_skipped = self._write_indexes(all_dirs)
+        removed = self._prune_stale(all_dirs)
+        self._prune_cache(skipped, page_keys)
+
+        # Written last, so an interrupted run is rebuilt from scratch next time
+        with open(fingerprint_file, "w", encoding="utf-8") as f:
+            f.write(fingerprint)
+
+        print(f"📝 {len(page_keys)} pages and {indexes_written} indexes written")
+        if skipped or indexes_skipped:
+            print(
+                f"⏭️ {len(skipped)} pages and {indexes_skipped} indexes unchanged"
+                " (use --force to rebuild)"
+            )
+        if removed:
+            print(f"🗑️ {removed} stale pages and directories removed")
 
         print(f"\n🎉 Site generated successfully in '{self.output_dir}'!")
         print(f"📊 Ready for GitHub Pages deployment")
@@ -648,9 +1203,7 @@ class FastSiteGenerator:
 
 def main():
     """Main execution"""
-    import sys
-
-    # Check for required dependency
+    # Check for required dependencies
     try:
         import markdown
     except ImportError:
@@ -661,16 +1214,22 @@ def main():
     # Parse arguments
     source_dir = "."
     output_dir = "docs"
-    format_markdown = True
 
-    if len(sys.argv) > 1:
-        source_dir = sys.argv[1]
-    if len(sys.argv) > 2:
-        output_dir = sys.argv[2]
-    if len(sys.argv) > 3:
-        format_markdown = sys.argv[3].lower() not in ["false", "0", "no"]
+    # --force wipes the output directory and render cache and rebuilds every page;
+    # --quiet prints only errors and the summary
+    flags = {arg for arg in sys.argv[1:] if arg.startswith("--")}
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    incremental = "--force" not in flags
+    verbose = "--quiet" not in flags
+
+    if len(args) > 0:
+        source_dir = args[0]
+    if len(args) > 1:
+        output_dir = args[1]
 
-    generator = FastSiteGenerator(source_dir, output_dir, format_markdown)
+    generator = FastSiteGenerator(
+        source_dir, output_dir, incremental=incremental, verbose=verbose
+    )
     generator.generate_site()
 
     print(